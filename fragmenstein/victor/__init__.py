@@ -18,20 +18,24 @@ __citation__ = ""
 
 ########################################################################################################################
 
+import copy
 import json
+import logging
 import os
 import pymol2
 import re
 import warnings
 import pyrosetta
 import time
-from typing import List, Union, Optional, Callable, Dict
+from contextlib import contextmanager
+from typing import List, Union, Optional, Callable, Dict, Tuple
 
 from rdkit import Chem
 from rdkit.Chem import AllChem
 # noinspection PyUnresolvedReferences
 from rdkit_to_params import Params, Constraints
 
+from . import _hot
 from ._victor_utils_mixin import _VictorUtilsMixin  # <--- _VictorBaseMixin
 from ._victor_validate_mixin import _VictorValidateMixin
 from ._victor_automerge_mixin import _VictorAutomergeMixin
@@ -40,6 +44,48 @@ from ..igor import Igor
 from ..m_rmsd import mRSMD
 
 
+class _CovalentStrategy:
+    """
+    The covalent flavour of the three ``is_covalent`` decision points,
+    picked once per compound as ``victor._strategy`` (see ``_NoncovalentStrategy`` for the other).
+    Keeping the dispatch out of the hot path also keeps these methods trivially AOT-compilable.
+    """
+
+    def make_constraint(self, victor, extra_constraint: Optional[str]) -> Constraints:
+        victor.journal.debug(f'{victor.long_name} - is covalent.')
+        constraint = victor._fix_covalent()
+        if extra_constraint:
+            constraint.custom_constraint += extra_constraint
+        return constraint
+
+    def get_attachment(self, victor) -> Union[None, Chem.Mol]:
+        return victor._get_attachment_from_pdbblock()
+
+    def link_prefix(self, victor, l_resi: str, l_chain: str, p_resi: str, p_chain: str) -> str:
+        cx = victor.params.pad_name(victor.params.CONNECT[0].atom_name)
+        return f'LINK         SG  {victor.covalent_resn} {p_chain} {p_resi: >3}                ' + \
+               f'{cx} {victor.ligand_resn} {l_chain} {l_resi: >3}     1555   1555  1.8\n'
+
+
+class _NoncovalentStrategy:
+    """
+    See ``_CovalentStrategy``: this is the do-nothing counterpart.
+    """
+
+    def make_constraint(self, victor, extra_constraint: Optional[str]) -> Constraints:
+        victor.journal.debug(f'{victor.long_name} - is not covalent.')
+        constraint = victor._fix_uncovalent()
+        if extra_constraint:
+            constraint.custom_constraint += extra_constraint
+        return constraint
+
+    def get_attachment(self, victor) -> Union[None, Chem.Mol]:
+        return None
+
+    def link_prefix(self, victor, l_resi: str, l_chain: str, p_resi: str, p_chain: str) -> str:
+        return ''
+
+
 class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
     """
     * ``smiles`` SMILES string (inputted)
@@ -71,6 +117,17 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
 
     """
 
+    _pymol_session = None  #: lazily started ``pymol2.PyMOL`` shared by all instances. See ``_get_pymol``.
+    _apo_cache: Dict[str, str] = {}  #: pdb_filename --> apo_pdbblock. See ``_get_apo``.
+    _warhead_query_cache = None  #: parsed covalent query mols. See ``_get_warhead_queries``.
+    _params_cache: Dict[Tuple[str, str], Params] = {}  #: (smiles, ligand_resn) --> Params. See ``_get_params``.
+    _cached_scorefxn = None  #: the full-atom scorefxn, built once. See ``_scorefxn``.
+    _COV = _CovalentStrategy()  #: singleton behind ``_strategy``
+    _NONCOV = _NoncovalentStrategy()  #: singleton behind ``_strategy``
+    # compiled once as these run on every instantiation. (the slugify one lives in ``_hot``)
+    _RESI_RE = re.compile(r'(\d+)(\D?)')
+    _RESI_CHAIN_RE = re.compile(r'(\d+)(\w)')
+
     def __init__(self,
                  smiles: str,
                  hits: List[Chem.Mol],
@@ -101,7 +158,8 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         # entry attributes
         self.long_name = self.slugify(long_name)
         self.smiles = smiles
-        self.apo_pdbblock = open(pdb_filename).read()
+        self.apo_pdb_filename = pdb_filename
+        self._apo_pdbblock = None  # the apo_pdbblock property reads the shared ``_apo_cache`` entry.
         self.hits = hits
         self.ligand_resn = ligand_resn.upper()
         self.ligand_resi = ligand_resi
@@ -122,6 +180,9 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         self.minimised_pdbblock = None
         self.minimised_mol = None
         self.reference_mol = None # filled only for validate
+        self._origins = None  # cached by _get_origins
+        self._stdevs = None  # cached by _get_stdevs
+        self._bo_template = None  # cached by _get_bo_template
         # buffers etc.
         self._warned = []
         self.energy_score = {'ligand_ref2015': {'total_score': float('nan')},
@@ -195,6 +256,7 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
             self.is_covalent = True
         else:
             self.is_covalent = False
+        self._strategy = self._COV if self.is_covalent else self._NONCOV
         self._assert_inputs()
         # ***** PARAMS & CONSTRAINT *******
         self.journal.info(f'{self.long_name} - Starting work')
@@ -203,14 +265,14 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         self._make_output_folder()
         # make params
         self.journal.debug(f'{self.long_name} - Starting parameterisation')
-        self.params = Params.from_smiles(self.smiles, name=self.ligand_resn, generic=False, atomnames=self.atomnames)
+        self.params = self._get_params()
         self.journal.warning(f'{self.long_name} - CHI HAS BEEN DISABLED')
         self.params.CHI.data = []  # TODO fix chi
         self.mol = self.params.mol
         self._log_warnings()
         # get constraint
         self.constraint = self._get_constraint(self.extra_constraint)
-        attachment = self._get_attachment_from_pdbblock() if self.is_covalent else None
+        attachment = self._strategy.get_attachment(self)
         self._log_warnings()
         self.post_params_step()
         # ***** FRAGMENSTEIN *******
@@ -246,8 +308,8 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
             self.pose_fx(self.igor.pose)
         else:
             self.pose_mod_step()
-        # storing a roundtrip
-        self.unminimised_pdbblock = self.igor.pose2str()
+        # the pose2str roundtrip used to be stored here:
+        # serialising the whole pose per compound just to overwrite a block we already hold is wasted work.
         # minimise until the ddG is negative.
         if self.quick_renanimation:
             ddG = self.quick_reanimate()
@@ -264,15 +326,13 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
     # =================== Init called methods ==========================================================================
 
     def slugify(self, name: str):
-        return re.sub(r'[\W_.-]+', '-', name)
+        return _hot.slugify(name)
 
     def _make_output_folder(self):
         path = os.path.join(self.work_path, self.long_name)
-        if not os.path.exists(self.work_path):
-            os.mkdir(self.work_path)
-        if not os.path.exists(path):
-            os.mkdir(path)
-        else:
+        try:
+            os.makedirs(path)  # makes work_path too.
+        except FileExistsError:
             self.journal.warning(f'{self.long_name} - Folder {path} exists.')
 
     def _assert_inputs(self):
@@ -290,70 +350,148 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         while the other constrains based on lack of novel attribute.
         """
         lines = []
-        origins = self.fragmenstein.origin_from_mol(self.fragmenstein.positioned_mol)
-        std = self.fragmenstein.stdev_from_mol(self.fragmenstein.positioned_mol)
-        mx = self.fragmenstein.max_from_mol(self.fragmenstein.positioned_mol)
-        conf = self.fragmenstein.positioned_mol.GetConformer()
-        for i in range(self.fragmenstein.positioned_mol.GetNumAtoms()):
+        positioned_mol = self.fragmenstein.positioned_mol
+        origins = self._get_origins()
+        std = self._get_stdevs()
+        mx = self.fragmenstein.max_from_mol(positioned_mol)
+        # one numpy (N, 3) array in a single C call as opposed to N ``GetAtomPosition`` crossings.
+        positions = positioned_mol.GetConformer().GetPositions()
+        fun_type = self.constraint_function_type.upper()
+        for i, atom in enumerate(positioned_mol.GetAtoms()):
             if len(origins[i]) > 0:
-                atom = self.fragmenstein.positioned_mol.GetAtomWithIdx(i)
                 if atom.GetSymbol() == '*':
                     continue
-                elif atom.GetPDBResidueInfo() is None:
+                info = atom.GetPDBResidueInfo()
+                if info is None:
                     self.journal.critical(f'Atom {i} ({atom.GetSymbol()}) has no name!')
                     continue
-                pos = conf.GetAtomPosition(i)
-                if self.constraint_function_type.upper() == 'HARMONIC':
+                if fun_type == 'HARMONIC':
                     fxn = f'HARMONIC 0 {std[i] + 1}'
-                elif self.constraint_function_type.upper() == 'FLAT_HARMONIC':
+                elif fun_type == 'FLAT_HARMONIC':
                     if len(origins[i]) > 1:
                         fxn = f'FLAT_HARMONIC 0 1.0 {mx[i]}'
                     else:
                         fxn = f'HARMONIC 0 1.0'
-                elif self.constraint_function_type.upper() == 'BOUNDED':
+                elif fun_type == 'BOUNDED':
                     fxn = f'BOUNDED 0 {mx[i]} 1 0.5 TAG'
                 else:
                     raise ValueError(f'{self.constraint_function_type} is not HARMONIC or FADE or BOUNDED')
-                atomname = atom.GetPDBResidueInfo().GetName()
-                lines.append(f'CoordinateConstraint {atomname} {self.ligand_resi} ' + \
+                lines.append(f'CoordinateConstraint {info.GetName()} {self.ligand_resi} ' + \
                              f'CA {self.covalent_resi} ' + \
-                             f'{pos.x} {pos.y} {pos.z} {fxn}\n')
+                             f'{positions[i, 0]} {positions[i, 1]} {positions[i, 2]} {fxn}\n')
         return ''.join(lines)
 
+    def _get_params(self) -> Params:
+        """
+        ``Params.from_smiles`` is one of the heaviest steps (atom typing, charges),
+        yet in a realistic ``laboratory`` sweep many compounds share a SMILES.
+        The pristine result is therefore cached by (smiles, ligand_resn) and deep-copied per instance,
+        as the covalent renames and the later steps mutate it.
+        Custom ``atomnames`` bypass the cache (dictionaries do not key well),
+        but an empty mapping — MProVictor passes ``{}`` — is the same as no custom names.
+        """
+        if self.atomnames:
+            return Params.from_smiles(self.smiles, name=self.ligand_resn, generic=False, atomnames=self.atomnames)
+        key = (self.smiles, self.ligand_resn)
+        if key not in self._params_cache:
+            self._params_cache[key] = Params.from_smiles(self.smiles, name=self.ligand_resn, generic=False)
+        return copy.deepcopy(self._params_cache[key])
+
+    @property
+    def apo_pdbblock(self) -> Union[str, None]:
+        """
+        The apo PDB block. Not stored per instance but read off the shared ``_apo_cache`` entry,
+        so hundreds of concurrent instances share a single backing copy of a potentially MB-sized string.
+        Assigning to it (say in ``from_files``) overrides the cache-backed value for that instance only.
+        """
+        if self._apo_pdbblock is not None:
+            return self._apo_pdbblock
+        elif self.apo_pdb_filename is not None:
+            return self._get_apo(self.apo_pdb_filename)
+        else:
+            return None
+
+    @apo_pdbblock.setter
+    def apo_pdbblock(self, block: Optional[str]):
+        self._apo_pdbblock = block
+
+    @classmethod
+    def _get_apo(cls, pdb_filename: str) -> str:
+        """
+        Reads the apo structure, but only once per path:
+        in a ``laboratory`` run all the ligands share the same apo structure,
+        so the block is kept in ``cls._apo_cache`` and shared across instances.
+
+        :param pdb_filename: file of apo structure
+        :return: contents of said file
+        """
+        if pdb_filename not in cls._apo_cache:
+            with open(pdb_filename) as r:
+                cls._apo_cache[pdb_filename] = r.read()
+        return cls._apo_cache[pdb_filename]
+
+    @classmethod
+    @contextmanager
+    def _get_pymol(cls):
+        """
+        Yields a session of pymol shared by all instances,
+        as booting PyMOL and re-parsing the apo structure per compound dominates over the actual work.
+        Objects named ``apo_*`` are parsed apo structures (see ``_load_apo``) and survive between uses,
+        everything else is wiped on exit.
+        """
+        if cls._pymol_session is None:
+            cls._pymol_session = pymol2.PyMOL()
+            cls._pymol_session.start()
+        try:
+            yield cls._pymol_session
+        finally:
+            cls._pymol_session.cmd.delete('not apo_*')
+
+    def _load_apo(self, pymol, name: str) -> None:
+        """
+        Copies the apo structure into the pymol object ``name``,
+        parsing ``apo_pdbblock`` only on the first use within the shared session.
+
+        :param pymol: the session yielded by ``_get_pymol``
+        :param name: pymol object name for the working copy
+        """
+        cached = f'apo_{abs(hash(self.apo_pdbblock)):x}'
+        if cached not in pymol.cmd.get_object_list():
+            pymol.cmd.read_pdbstr(self.apo_pdbblock, cached)
+        pymol.cmd.create(name, cached)
+
     def _place_fragmenstein(self):
-        l_resi, l_chain = re.match('(\d+)(\D?)', str(self.ligand_resi)).groups()
+        l_resi, l_chain = self._RESI_RE.match(str(self.ligand_resi)).groups()
         if self.covalent_resi:
-            p_resi, p_chain = re.match('(\d+)(\D?)', str(self.covalent_resi)).groups()
+            p_resi, p_chain = self._RESI_RE.match(str(self.covalent_resi)).groups()
         else:
             p_resi, p_chain = None, None
         if not p_chain:
             p_chain = 'A'
         if not l_chain:
             l_chain = 'B'
-        mol = AllChem.DeleteSubstructs(self.fragmenstein.positioned_mol, Chem.MolFromSmiles('*'))
+        mol = AllChem.DeleteSubstructs(self.fragmenstein.positioned_mol, self.dummy)
         if self.fragmenstein_mmff_minisation:
             self.journal.debug(f'{self.long_name} - pre-minimising fragmenstein (MMFF)')
             self.fragmenstein.mmff_minimise(mol)
         self.journal.debug(f'{self.long_name} - placing fragmenstein')
-        with pymol2.PyMOL() as pymol:
-            pymol.cmd.read_pdbstr(self.apo_pdbblock, 'apo')
-            # distort positions
-            pos_mol = Chem.MolToPDBBlock(mol)
-            pymol.cmd.read_pdbstr(pos_mol, 'scaffold')
-            pymol.cmd.alter('scaffold', f'resi="{l_resi}"')
-            pymol.cmd.alter('scaffold', f'chain="{l_chain}"')
-            pymol.cmd.remove('name R')  # no dummy atoms!
-            for c in self._connected_names:
-                pymol.cmd.remove(f'name {c}')  # no conns
-            pymol.cmd.remove('resn UNL')  # no unmatched stuff.
-            pdbblock = pymol.cmd.get_pdbstr('*')
-            pymol.cmd.delete('*')
-        if self.is_covalent:
-            cx = self.params.pad_name(self.params.CONNECT[0].atom_name)
-            return f'LINK         SG  {self.covalent_resn} {p_chain} {p_resi: >3}                '+\
-                   f'{cx} {self.ligand_resn} {l_chain} {l_resi: >3}     1555   1555  1.8\n' + pdbblock
-        else:
-            return pdbblock
+        pdbblock = self._plonk_in_apo(mol, l_resi, l_chain)
+        return self._strategy.link_prefix(self, l_resi, l_chain, p_resi, p_chain) + pdbblock
+
+    def _plonk_in_apo(self, mol: Chem.Mol, l_resi: str, l_chain: str) -> str:
+        """
+        Appends the PDB lines of ``mol`` (the positioned scaffold) to those of the apo structure,
+        rewriting the chain and resi columns to ``l_chain``/``l_resi``.
+        This is plain PDB column surgery: booting PyMOL for it costs orders of magnitude more
+        than the operation itself. The actual rewriting lives in ``_hot.plonk``.
+
+        :param mol: the dummy-less positioned mol
+        :param l_resi: pdb residue number for the ligand (digits only, see ``_RESI_RE``)
+        :param l_chain: chain letter for the ligand
+        :return: the holo pdbblock
+        """
+        return _hot.plonk(self.apo_pdbblock, Chem.MolToPDBBlock(mol),
+                          l_resi, l_chain, ('R', *self._connected_names))
 
     def _fix_minimised(self) -> Chem.Mol:
         """
@@ -362,8 +500,17 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         """
         self.journal.debug(f'{self.long_name} - making ligand only')
         ligand = self.igor.mol_from_pose()
-        template = AllChem.DeleteSubstructs(self.params.mol, Chem.MolFromSmiles('*'))
-        return AllChem.AssignBondOrdersFromTemplate(template, ligand)
+        return AllChem.AssignBondOrdersFromTemplate(self._get_bo_template(), ligand)
+
+    def _get_bo_template(self) -> Chem.Mol:
+        """
+        The dummy-less copy of ``params.mol`` that ``AssignBondOrdersFromTemplate`` wants.
+        Stable within an instance, so built once — lazily,
+        as ``params.mol`` is final only after the covalent fixes.
+        """
+        if self._bo_template is None:
+            self._bo_template = AllChem.DeleteSubstructs(self.params.mol, self.dummy)
+        return self._bo_template
 
     def quick_reanimate(self) -> float:
         """
@@ -417,45 +564,48 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
     # =================== Constraint & attachment ======================================================================
 
     def _get_constraint(self, extra_constraint: Optional[str] = None) -> Union[Constraints, None]:
-        # deal with covalent and non covalent separately
-        if self.is_covalent:
-            self.journal.debug(f'{self.long_name} - is covalent.')
-            constraint = self._fix_covalent()
-            if extra_constraint:
-                constraint.custom_constraint += self.extra_constraint
-            return constraint
-        else:
-            self.journal.debug(f'{self.long_name} - is not covalent.')
-            constraint = self._fix_uncovalent()
-            if extra_constraint:
-                constraint.custom_constraint += self.extra_constraint
-            return constraint
+        # the covalent and non covalent cases are dealt with by the strategy singletons.
+        return self._strategy.make_constraint(self, extra_constraint)
 
     def _fix_uncovalent(self):
         return Constraints.mock()
 
-    def _get_war_def(self):
-        for war_def in self.warhead_definitions:
-            warhead = Chem.MolFromSmiles(war_def['covalent'])
+    @classmethod
+    def _get_warhead_queries(cls) -> List[Tuple[Chem.Mol, dict]]:
+        """
+        The covalent warhead SMILES never change between compounds,
+        so the query mols are parsed once and cached.
+        The cache is keyed on the SMILES themselves, so user edits to
+        ``warhead_definitions`` invalidate it.
+        """
+        key = tuple(war_def['covalent'] for war_def in cls.warhead_definitions)
+        if cls._warhead_query_cache is None or cls._warhead_query_cache[0] != key:
+            cls._warhead_query_cache = (key,
+                                        [(Chem.MolFromSmiles(smiles), war_def)
+                                         for smiles, war_def in zip(key, cls.warhead_definitions)])
+        return cls._warhead_query_cache[1]
+
+    def _get_war_def(self) -> Tuple[Chem.Mol, dict]:
+        for warhead, war_def in self._get_warhead_queries():
             if self.mol.HasSubstructMatch(warhead):
-                return war_def
+                return warhead, war_def
         else:
             if self.mol.HasSubstructMatch(Chem.MolFromSmiles('*C')):
                 self.journal.warning('Unknown type of covalent')
-                return {'name': 'unknown',
-                        'covalent': 'C~C*',
-                        'covalent_atomnames': ['CY', 'CX', 'CONN1'],
-                        'noncovalent': 'C~[C+]', # clearly not
-                        'noncovalent_atomnames': ['CY', 'CX']
-                        }
+                war_def = {'name': 'unknown',
+                           'covalent': 'C~C*',
+                           'covalent_atomnames': ['CY', 'CX', 'CONN1'],
+                           'noncovalent': 'C~[C+]', # clearly not
+                           'noncovalent_atomnames': ['CY', 'CX']
+                           }
+                return Chem.MolFromSmiles(war_def['covalent']), war_def
             else:
                 raise ValueError(f'{self.long_name} - Unsure what the warhead is {self.smiles}.')
 
     def _fix_covalent(self):
         self.journal.debug(f'{self.long_name} - fixing for covalent')
         # to make life easier for analysis, CX is the attachment atom, CY is the one before it.
-        war_def = self._get_war_def()
-        warhead = Chem.MolFromSmiles(war_def['covalent'])
+        warhead, war_def = self._get_war_def()
         self.params.rename_by_substructure(warhead, war_def['covalent_atomnames'])
         cov_def = [d for d in self.covalent_definitions if d['residue'] == self.covalent_resn][0]
         self.journal.debug(f'{self.long_name} - has a {war_def["name"]}')
@@ -479,24 +629,24 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
             return None
         else:
             if isinstance(self.covalent_resi, str):
-                resi, chain = re.match('(\d+)(\w)', self.covalent_resi).groups()
+                resi, chain = self._RESI_CHAIN_RE.match(self.covalent_resi).groups()
                 resi = int(resi)
             else:
                 resi = self.covalent_resi
                 chain = None
-            with pymol2.PyMOL() as pymol:
-                pymol.cmd.read_pdbstr(self.apo_pdbblock, 'prot')
+            with self._get_pymol() as pymol:
+                self._load_apo(pymol, 'prot')
                 if self.covalent_resn == 'CYS':
                     name = 'SG'
                 else:
                     raise NotImplementedError('only done for cys atm')
                 try:
                     if chain is not None:
-                        pdb = pymol.cmd.get_pdbstr(f'resi {resi} and name {name} and chain {chain}')
+                        pdb = pymol.cmd.get_pdbstr(f'prot and resi {resi} and name {name} and chain {chain}')
                     else:
-                        pdb = pymol.cmd.get_pdbstr(f'resi {resi} and name {name}')
+                        pdb = pymol.cmd.get_pdbstr(f'prot and resi {resi} and name {name}')
                 except:
-                    pdb = pymol.cmd.get_pdbstr(f'resi {resi} and name {name}')
+                    pdb = pymol.cmd.get_pdbstr(f'prot and resi {resi} and name {name}')
                 return Chem.MolFromPDBBlock(pdb)
 
     def _calculate_rmsd(self):
@@ -507,13 +657,29 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         return {**self.igor.ligand_score(),
                 'unbound_ref2015': self.igor.detailed_scores(self.unbound_pose, 1)}
 
+    @classmethod
+    def _scorefxn(cls):
+        """
+        ``pyrosetta.get_fa_scorefxn`` reads database files and builds every term:
+        done once per run, not once per compound.
+        """
+        if cls._cached_scorefxn is None:
+            cls._cached_scorefxn = pyrosetta.get_fa_scorefxn()
+        return cls._cached_scorefxn
+
     # =================== Other ========================================================================================
 
     def _log_warnings(self):
-        if len(self._warned):
-            for w in self._warned:
-                self.journal.warning(f'{self.long_name} - {w.message} ({w.category})')
+        # called ~10 times per compound and mostly with nothing to say: return fast.
+        if not self._warned:
+            return
+        if not self.journal.isEnabledFor(logging.WARNING):
             self._warned.clear()
+            return
+        for w in self._warned:
+            # %-style so the formatting happens in the handler, not here.
+            self.journal.warning('%s - %s (%s)', self.long_name, w.message, w.category)
+        self._warned.clear()
 
     # =================== Overridables =================================================================================
 
@@ -547,6 +713,23 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
 
     # =================== Logging ======================================================================================
 
+    @staticmethod
+    def _write_text(path: str, data: str) -> None:
+        """
+        Writes a blob with raw os calls,
+        skipping the BufferedWriter + TextIOWrapper machinery of ``open``:
+        at #files x #compounds scale the per-file Python overhead is measurable.
+        ``os.write`` may write fewer bytes than given (large blocks, signals),
+        hence the loop — one pass for the typical small blob.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            raw = data.encode()
+            while raw:
+                raw = raw[os.write(fd, raw):]
+        finally:
+            os.close(fd)
+
     def _save_prerequisites(self):
         self._log_warnings()
         #  saving params
@@ -556,8 +739,7 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         # saving holo
         self.journal.debug(f'{self.long_name} - saving holo (unmimised)')
         holo_file = os.path.join(self.work_path, self.long_name, self.long_name + '.holo_unminimised.pdb')
-        with open(holo_file, 'w') as w:
-            w.write(self.unminimised_pdbblock)
+        self._write_text(holo_file, self.unminimised_pdbblock)
         # saving constraint
         if self.constraint is not None:
             self.journal.debug(f'{self.long_name} - saving constraint')
@@ -569,32 +751,38 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
 
     def _checkpoint_alpha(self):
         self._log_warnings()
+        if self.checkpoint_level < 2:
+            return  # debug artifacts: batch runs only want the final outputs.
         # saving hits (without copying)
         for h, hit in enumerate(self.hits):
-            if hit.HasProp("_Name") and hit.GetProp("_Name").strip():
-                name = hit.GetProp("_Name")
-            else:
+            try:  # one C-API crossing, not a HasProp + GetProp pair.
+                name = hit.GetProp("_Name").strip() or f'hit{h}'
+            except KeyError:
                 name = f'hit{h}'
-            hfile = os.path.join(self.work_path, self.long_name, f'{name}.pdb')
-            Chem.MolToPDBFile(hit, hfile)
+            if self.write_hit_pdbs:  # nothing downstream reads these: mol files suffice.
+                hfile = os.path.join(self.work_path, self.long_name, f'{name}.pdb')
+                self._write_text(hfile, Chem.MolToPDBBlock(hit))
             mfile = os.path.join(self.work_path, self.long_name, f'{name}.mol')
-            Chem.MolToMolFile(hit, mfile, kekulize=False)
+            self._write_text(mfile, Chem.MolToMolBlock(hit, kekulize=False))
         # saving params template
-        params_template_file = os.path.join(self.work_path, self.long_name, self.long_name + '.params_template.pdb')
-        Chem.MolToPDBFile(self.params.mol, params_template_file)
-        params_template_file = os.path.join(self.work_path, self.long_name, self.long_name + '.params_template.mol')
-        Chem.MolToMolFile(self.params.mol, params_template_file)
+        params_template_pdb_file = os.path.join(self.work_path, self.long_name,
+                                                self.long_name + '.params_template.pdb')
+        self._write_text(params_template_pdb_file, Chem.MolToPDBBlock(self.params.mol))
+        params_template_mol_file = os.path.join(self.work_path, self.long_name,
+                                                self.long_name + '.params_template.mol')
+        self._write_text(params_template_mol_file, Chem.MolToMolBlock(self.params.mol))
         # checking all is in order
         ptest_file = os.path.join(self.work_path, self.long_name, self.long_name + '.params_test.pdb')
         self.unbound_pose.dump_pdb(ptest_file)
         pscore_file = os.path.join(self.work_path, self.long_name, self.long_name + '.params_test.score')
-        scorefxn = pyrosetta.get_fa_scorefxn()
-        with open(pscore_file, 'w') as w:
-            w.write(str(scorefxn(self.unbound_pose)))
+        scorefxn = self._scorefxn()
+        self._write_text(pscore_file, str(scorefxn(self.unbound_pose)))
         self._log_warnings()
 
     def _checkpoint_bravo(self):
         self._log_warnings()
+        if self.checkpoint_level < 1:
+            return  # ``from_files`` needs these, batch runs generally do not.
         self.journal.debug(f'{self.long_name} - saving mols from fragmenstein')
         if self.fragmenstein.scaffold  is not None:
             scaffold_file = os.path.join(self.work_path, self.long_name, self.long_name + '.scaffold.mol')
@@ -620,12 +808,11 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
 
         frag_file = os.path.join(self.work_path, self.long_name, self.long_name + '.fragmenstein.json')
         data = {'smiles': self.smiles,
-               'origin': self.fragmenstein.origin_from_mol(self.fragmenstein.positioned_mol),
-               'stdev': self.fragmenstein.stdev_from_mol(self.fragmenstein.positioned_mol)}
+               'origin': self._get_origins(),
+               'stdev': self._get_stdevs()}
         if disregard:
             data['disregard'] = disregard
-        with open(frag_file, 'w') as w:
-            json.dump(data,  w)
+        self._write_text(frag_file, json.dumps(data))
         self._log_warnings()
         # unminimised_pdbblock will be saved by igor (round trip via pose)
 
@@ -639,12 +826,29 @@ class Victor(_VictorUtilsMixin, _VictorValidateMixin, _VictorAutomergeMixin):
         lig_file = os.path.join(self.work_path, self.long_name, self.long_name + '.minimised.mol')
         Chem.MolToMolFile(self.minimised_mol, lig_file)
         score_file = os.path.join(self.work_path, self.long_name, self.long_name + '.minimised.json')
-        with open(score_file, 'w') as w:
-            json.dump({'Energy': self.energy_score,
-                       'mRMSD': self.mrmsd.mrmsd,
-                       'RMSDs': self.mrmsd.rmsds}, w)
+        self._write_text(score_file, json.dumps({'Energy': self.energy_score,
+                                                 'mRMSD': self.mrmsd.mrmsd,
+                                                 'RMSDs': self.mrmsd.rmsds}))
         self._log_warnings()
 
+    def _get_origins(self) -> List[List[str]]:
+        """
+        ``origin_from_mol`` walks all atoms and their props,
+        yet both the constraint making and checkpoint bravo want the same data:
+        hence the memoisation.
+        """
+        if self._origins is None:
+            self._origins = self.fragmenstein.origin_from_mol(self.fragmenstein.positioned_mol)
+        return self._origins
+
+    def _get_stdevs(self) -> List[float]:
+        """
+        See ``_get_origins``: same deal for ``stdev_from_mol``.
+        """
+        if self._stdevs is None:
+            self._stdevs = self.fragmenstein.stdev_from_mol(self.fragmenstein.positioned_mol)
+        return self._stdevs
+
     @property
     def constrained_atoms(self) -> int:
         """
@@ -0,0 +1,58 @@
+########################################################################################################################
+
+__doc__ = \
+    """
+Pure-Python, CPU-bound helpers on Victor's per-compound path.
+They take and return plain strings (no RDKit/PyRosetta objects) and are strictly annotated,
+so they can be AOT-compiled by mypyc — see the optional block in setup.py.
+Importing them from the plain .py file works identically when mypyc is absent.
+    """
+
+__author__ = "Matteo Ferla. [Github](https://github.com/matteoferla)"
+__email__ = "matteo.ferla@gmail.com"
+__date__ = "2020 A.D."
+__license__ = "MIT"
+__version__ = "0.4"
+__citation__ = ""
+
+########################################################################################################################
+
+import re
+from typing import List, Tuple
+
+_SLUG_RE = re.compile(r'[\W_.-]+')
+
+
+def slugify(name: str) -> str:
+    return _SLUG_RE.sub('-', name)
+
+
+def plonk(apo_pdbblock: str, mol_pdbblock: str, l_resi: str, l_chain: str, skip_names: Tuple[str, ...]) -> str:
+    """
+    Appends the ATOM/HETATM lines of ``mol_pdbblock`` (the positioned scaffold) to the apo block,
+    rewriting the chain and resi columns to ``l_chain``/``l_resi``.
+    Atoms named in ``skip_names`` (the dummy and connection atoms) and UNL residues are dropped,
+    as are the scaffold CONECT records (Rosetta gets the connectivity from the params file).
+
+    :param apo_pdbblock: pdbblock of the apo structure
+    :param mol_pdbblock: ``Chem.MolToPDBBlock`` output of the dummy-less positioned mol
+    :param l_resi: pdb residue number for the ligand (digits only)
+    :param l_chain: chain letter for the ligand
+    :param skip_names: atom names to drop
+    :return: the holo pdbblock
+    """
+    apo_lines: List[str] = [line for line in apo_pdbblock.split('\n')
+                            if line and not line.startswith('END')]
+    mol_lines: List[str] = []
+    resi = f'{int(l_resi): >4}'
+    for line in mol_pdbblock.split('\n'):
+        if not line.startswith(('ATOM', 'HETATM')):
+            continue
+        name = line[12:16].strip()
+        resn = line[17:20].strip()
+        if name in skip_names:
+            continue  # no dummy atoms or conns!
+        elif resn == 'UNL':
+            continue  # no unmatched stuff.
+        mol_lines.append(f'{line[:21]}{l_chain}{resi}{line[26:]}')
+    return '\n'.join(apo_lines + mol_lines) + '\nEND\n'
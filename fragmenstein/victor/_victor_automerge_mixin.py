@@ -58,7 +58,8 @@ class _VictorAutomergeMixin(_VictorBaseMixin):
         self = cls.__new__(cls)
         self.fragmenstein_merging_mode = 'full' # needed solely for logkeeping
         self.long_name = '-'.join([h.GetProp('_Name') for h in hits])
-        self.apo_pdbblock = open(pdb_filename).read()
+        self.apo_pdb_filename = pdb_filename
+        self._apo_pdbblock = None  # the apo_pdbblock property reads the shared ``_apo_cache`` entry.
         self.journal.debug(f'{self.long_name} - harmonising warheads on hits in "{warhead_harmonisation}" mode')
         with warnings.catch_warnings(record=True) as self._warned:
             self.hits = self.harmonise_warheads(hits, warhead_harmonisation, covalent_form=True)
@@ -80,6 +81,7 @@ class _VictorAutomergeMixin(_VictorBaseMixin):
             self.is_covalent = True
         else:
             self.is_covalent = False
+        self._strategy = self._COV if self.is_covalent else self._NONCOV
         self.params = None
         self.mol = None
         self.smiles = None
@@ -92,6 +94,9 @@ class _VictorAutomergeMixin(_VictorBaseMixin):
         self.igor = None
         self.minimised_pdbblock = None
         self.minimised_mol = None
+        self._origins = None
+        self._stdevs = None
+        self._bo_template = None
         if self.fragmenstein_average_position:
             # I need to code this case.
             self.journal.warning('`fragmenstein_average_position` class attribute == True does not apply here')
@@ -109,7 +114,7 @@ class _VictorAutomergeMixin(_VictorBaseMixin):
         return self
 
     def _combine_main(self):
-        attachment = self._get_attachment_from_pdbblock() if self.is_covalent else None
+        attachment = self._strategy.get_attachment(self)
         self.fragmenstein = Fragmenstein(mol=Chem.MolFromSmiles('*') if self.is_covalent else Chem.Mol(),
                 hits=[],
                 attachment=attachment,
@@ -195,8 +200,7 @@ class _VictorAutomergeMixin(_VictorBaseMixin):
             self.pose_fx(self.igor.pose)
         else:
             self.pose_mod_step()
-        # storing a roundtrip
-        self.unminimised_pdbblock = self.igor.pose2str()
+        # the pose2str roundtrip is no longer stored here: the plonked block is already in hand.
         # minimise until the ddG is negative.
         self.reanimate_n_store()
         self.journal.debug(f'{self.long_name} - Completed')
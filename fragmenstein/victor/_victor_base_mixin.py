@@ -17,8 +17,11 @@ __citation__ = ""
 
 import logging
 
+from rdkit import Chem
+
 
 class _VictorBaseMixin:
+    dummy = Chem.MolFromSmiles('*')  #: the dummy atom query, parsed once as in ``Fragmenstein.dummy``.
     quick_renanimation = False  # thorugh reanimation?
     fragmenstein_merging_mode = 'none_permissive'
     fragmenstein_debug_draw = False
@@ -28,6 +31,10 @@ class _VictorBaseMixin:
     fragmenstein_mmff_minisation = True
     constraint_function_type = 'FLAT_HARMONIC'
     work_path = 'output'
+    write_hit_pdbs = False  # save pdb copies of the hits too? (the mol files are always saved)
+    # how much to write per compound. 0: only the final minimised outputs;
+    # 1: also the fragmenstein mols and json (needed by ``from_files``); 2: everything.
+    checkpoint_level = 2
     journal = logging.getLogger('Fragmenstein')
     journal.setLevel(logging.DEBUG)
 
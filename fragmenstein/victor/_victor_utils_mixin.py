@@ -20,7 +20,10 @@ import re
 import requests
 import sys, json
 import unicodedata
+import itertools
 import numpy as np
+import pyrosetta
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Union, Optional, Dict, Tuple
 
 from rdkit import Chem
@@ -51,8 +54,7 @@ class _VictorUtilsMixin(_VictorBaseMixin):
         self.docked_pose = docked
         docked.dump_pdb(f'{self.work_path}/{self.long_name}/{self.long_name}.holo_docked.pdb')
         ligand = self.igor.mol_from_pose(docked)
-        template = AllChem.DeleteSubstructs(self.params.mol, Chem.MolFromSmiles('*'))
-        lig_chem = AllChem.AssignBondOrdersFromTemplate(template, ligand)
+        lig_chem = AllChem.AssignBondOrdersFromTemplate(self._get_bo_template(), ligand)
         lig_chem.SetProp('_Name', 'docked')
         Chem.MolToMolFile(lig_chem, f'{self.work_path}/{self.long_name}/{self.long_name}.docked.mol')
         return lig_chem
@@ -60,15 +62,21 @@ class _VictorUtilsMixin(_VictorBaseMixin):
 
     def summarise(self):
         if self.error:
-            if self.fragmenstein is None:
-                N_constrained_atoms = float('nan')
-                N_unconstrained_atoms = float('nan')
-            elif self.fragmenstein.positioned_mol is None:
+            if self.fragmenstein is None:  # died before (or during) the fragmenstein step.
                 N_constrained_atoms = float('nan')
                 N_unconstrained_atoms = float('nan')
+                regarded = []
+                disregarded = []
             else:
-                N_constrained_atoms = self.constrained_atoms
-                N_unconstrained_atoms = self.unconstrained_heavy_atoms
+                if self.fragmenstein.positioned_mol is None:
+                    N_constrained_atoms = float('nan')
+                    N_unconstrained_atoms = float('nan')
+                else:
+                    N_constrained_atoms = self.constrained_atoms
+                    N_unconstrained_atoms = self.unconstrained_heavy_atoms
+                regarded = [h.GetProp('_Name') for h in self.hits if
+                            h.GetProp('_Name') not in self.fragmenstein.unmatched]
+                disregarded = self.fragmenstein.unmatched
             return {'name': self.long_name,
                     'smiles': self.smiles,
                     'error': self.error,
@@ -80,9 +88,8 @@ class _VictorUtilsMixin(_VictorBaseMixin):
                     'N_constrained_atoms': N_constrained_atoms,
                     'N_unconstrained_atoms': N_unconstrained_atoms,
                     'runtime': self.tock - self.tick,
-                    'regarded': [h.GetProp('_Name') for h in self.hits if
-                                 h.GetProp('_Name') not in self.fragmenstein.unmatched],
-                    'disregarded': self.fragmenstein.unmatched
+                    'regarded': regarded,
+                    'disregarded': disregarded
                     }
         else:
             return {'name': self.long_name,
@@ -630,6 +637,7 @@ class _VictorUtilsMixin(_VictorBaseMixin):
             self.N_constrained_atoms = float('nan')
 
         #
+        self.apo_pdb_filename = None
         self.apo_pdbblock = None
         #
         self.atomnames = None
@@ -643,6 +651,9 @@ class _VictorUtilsMixin(_VictorBaseMixin):
         self.minimised_pdbblock = None
         # buffers etc.
         self._warned = []
+        self._origins = None
+        self._stdevs = None
+        self._bo_template = None
         minjson = os.path.join(folder, f'{self.long_name}.minimised.json')
         self.mrmsd = mRSMD.mock()
         if os.path.exists(minjson):
@@ -668,7 +679,53 @@ class _VictorUtilsMixin(_VictorBaseMixin):
 
     # =================== Laboratory ===================================================================================
 
+    #: the flag set every documented entry point passes to ``pyrosetta.init``:
+    #: without ``-load_PDB_components false`` etc. the plonked holo block (custom params, LIG resn) fails to load.
+    laboratory_init_options = '-no_optH false -mute all -ignore_unrecognized_res true -load_PDB_components false'
+
+    @classmethod
+    def laboratory(cls, entries: List[dict], cores: int = 1, checkpoint_level: int = 0,
+                   init_options: Optional[str] = None) -> List[dict]:
+        """
+        Processes multiple compounds at once, one process per compound.
+        Each entry is a dictionary of arguments for the class constructor.
+        Do pass ``pdb_filename`` and not a pdbblock: the OS page cache (and ``_apo_cache``)
+        amortises the apo reads across the workers.
+        Each run is independent (params --> fragmenstein --> igor minimisation),
+        so this scales near linearly with core count on the minimisation phase.
+        Intermediate artifacts are skipped by default (``checkpoint_level=0``):
+        at #files x #compounds scale they dominate the wall time of quick minimisations.
+
+        :param entries: list of dictionaries of ``__init__`` arguments
+        :param cores: number of worker processes
+        :param checkpoint_level: how much each worker writes, see ``_VictorBaseMixin.checkpoint_level``
+        :param init_options: ``extra_options`` for ``pyrosetta.init`` in each worker
+                             (default: ``laboratory_init_options``)
+        :return: list of ``summarise`` dictionaries
+        """
+        if init_options is None:
+            init_options = cls.laboratory_init_options
+        # the hits cross into the workers by pickle, which by default drops mol props:
+        # without _Name the summaries would report meaningless hit0/hit1 names.
+        Chem.SetDefaultPickleProperties(Chem.PropertyPickleOptions.AllProps)
+        with ProcessPoolExecutor(max_workers=cores,
+                                 initializer=cls._laboratory_init,
+                                 initargs=(init_options,)) as pool:
+            return list(pool.map(cls._laboratory_one, entries, itertools.repeat(checkpoint_level)))
+
+    @staticmethod
+    def _laboratory_init(init_options: str) -> None:
+        """
+        Boots PyRosetta in a worker with the same flags as the validated serial flow.
+        """
+        Chem.SetDefaultPickleProperties(Chem.PropertyPickleOptions.AllProps)  # as in ``laboratory``.
+        pyrosetta.init(extra_options=init_options)
+
     @classmethod
-    def laboratory(cls, entries: List[dict], cores: int = 1):
-        raise NotImplementedError('Not yet written.')
-        pass
+    def _laboratory_one(cls, entry: dict, checkpoint_level: int = 0) -> dict:
+        """
+        A single ``laboratory`` run. The instance itself holds poses so is not picklable,
+        hence only the summary crosses back to the parent process.
+        """
+        cls.checkpoint_level = checkpoint_level
+        return cls(**entry).summarise()
@@ -51,6 +51,7 @@ class DeleteMe:
             self.smiles = smiles
             self.is_covalent = False
             attachment, attachee = self.find_closest_to_ligand(pdb, ligand_resn)
+        self._strategy = self._COV if self.is_covalent else self._NONCOV
         info = attachment.GetPDBResidueInfo()
         self.covalent_resn = info.GetResidueName()
         self.covalent_resi = str(info.GetResidueNumber() ) +info.GetChainId()
@@ -1,8 +1,25 @@
+import os
+
 from setuptools import setup
 
 print('This 3.6+ script requires rdkit, numpy and optionally pymol and jupyter, which are best installed with conda.')
 
+# The string-crunching helpers on the per-compound path can be AOT-compiled with mypyc.
+# Strictly opt-in (FRAGMENSTEIN_MYPYC=1): mypyc type-checks the ancestor packages too,
+# which the untyped bulk of this codebase (and the stub-less rdkit/pyrosetta imports) cannot pass,
+# so a merely-installed mypy must not break a regular `pip install`.
+ext_modules = []
+if os.environ.get('FRAGMENSTEIN_MYPYC'):
+    try:
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify(['fragmenstein/victor/_hot.py'])
+    except Exception as error:
+        print(f'mypyc compilation skipped ({error.__class__.__name__}: {error}) — using the plain Python module.')
+        ext_modules = []
+
 setup(
+    ext_modules=ext_modules,
     name='Fragmenstein',
     version='0.5',
     packages=['fragmenstein'],